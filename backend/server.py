@@ -1,15 +1,32 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Body, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pymongo import MongoClient
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from bson import ObjectId
+from bson.errors import InvalidId
+from cachetools import TTLCache
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 from pydantic import BaseModel, Field
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Any, List, Literal, Optional, get_args
+# The models have a field called `date`, so the type is imported under another name
+from datetime import date as Date, datetime, timedelta, timezone
+from functools import lru_cache
+import asyncio
+import logging
 import os
-import uuid
-from collections import defaultdict
+import re
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Gestão Financeira API", version="1.0.0")
+app = FastAPI(
+    title="Gestão Financeira API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS configuration
 app.add_middleware(
@@ -18,28 +35,60 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Compress larger JSON payloads (expense lists, summaries)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # MongoDB connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'finance_app')
+# Per worker process; keep MONGO_POOL_SIZE x workers below the server's connection limit
+MONGO_POOL_SIZE = int(os.environ.get('MONGO_POOL_SIZE', '20'))
+
+# Created on first use, so every uvicorn worker opens its own pool after forking
+@lru_cache
+def get_client() -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(MONGO_URL, maxPoolSize=MONGO_POOL_SIZE)
+
+async def get_expenses_collection() -> AsyncIOMotorCollection:
+    return get_client()[DB_NAME].expenses
+
+# Predefined categories; validated by pydantic-core through the Literal type
+Category = Literal[
+    "Alimentação",
+    "Transporte",
+    "Lazer",
+    "Saúde",
+    "Educação",
+    "Casa",
+    "Roupas",
+    "Tecnologia",
+    "Outros"
+]
+CATEGORIES = list(get_args(Category))
+# Serialized once, the list never changes at runtime
+CATEGORIES_JSON = orjson.dumps(CATEGORIES)
 
-client = MongoClient(MONGO_URL)
-db = client[DB_NAME]
-expenses_collection = db.expenses
+# Upper bounds for POST /api/expenses/bulk, POST /api/batch and GET /api/expenses pages
+MAX_BULK_EXPENSES = 1000
+MAX_BATCH_REQUESTS = 50
+MAX_BATCH_BODY_BYTES = 256 * 1024  # all sub-request bodies of one batch together
+MAX_PAGE_SIZE = 1000
 
 # Pydantic models
 class ExpenseCreate(BaseModel):
     description: str = Field(..., min_length=1, max_length=200)
     amount: float = Field(..., gt=0)
-    category: str = Field(..., min_length=1)
-    date: str = Field(...)  # Format: YYYY-MM-DD
+    category: Category
+    date: Date  # Format: YYYY-MM-DD
 
 class ExpenseUpdate(BaseModel):
     description: Optional[str] = Field(None, min_length=1, max_length=200)
     amount: Optional[float] = Field(None, gt=0)
-    category: Optional[str] = Field(None, min_length=1)
-    date: Optional[str] = None
+    category: Optional[Category] = None
+    date: Optional[Date] = None
 
 class ExpenseResponse(BaseModel):
     id: str
@@ -62,247 +111,470 @@ class CategorySummary(BaseModel):
     count: int
     percentage: float
 
-# Predefined categories
-CATEGORIES = [
-    "Alimentação",
-    "Transporte", 
-    "Lazer",
-    "Saúde",
-    "Educação",
-    "Casa",
-    "Roupas",
-    "Tecnologia",
-    "Outros"
-]
+class BulkInsertFailure(BaseModel):
+    index: int
+    detail: str
+
+class BulkInsertPartial(BaseModel):
+    detail: str
+    created: List[ExpenseResponse]
+    failed: List[BulkInsertFailure]
+
+class BatchItem(BaseModel):
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str = Field(..., pattern=r"^/api/")  # e.g. /api/expenses?limit=10
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_REQUESTS)
+
+class BatchItemResponse(BaseModel):
+    status: int
+    body: Any
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResponse]
+
+# Dates are stored as BSON dates (UTC) and rendered back as strings on read
+DATE_FORMAT = "%Y-%m-%d"
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%L+00:00"
+
+# Fields returned by the API; Mongo's _id is exposed as a string id
+PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "description": 1,
+    "amount": 1,
+    "category": 1,
+    "date": {"$dateToString": {"format": DATE_FORMAT, "date": "$date"}},
+    "created_at": {"$dateToString": {"format": TIMESTAMP_FORMAT, "date": "$created_at"}}
+}
+
+# Dashboard aggregations are reused for DASHBOARD_CACHE_TTL seconds (0 turns
+# the cache off) and dropped on every write. Each worker process keeps its own
+# cache and only sees its own writes, so with several workers another worker
+# can serve totals that are stale by at most the TTL
+DASHBOARD_CACHE_TTL = float(os.environ.get('DASHBOARD_CACHE_TTL', '10'))
+DASHBOARD_CACHE = TTLCache(maxsize=16, ttl=DASHBOARD_CACHE_TTL)
+# Bumped on every write so a computation that overlapped one is not cached
+_dashboard_generation = 0
 
 # Helper functions
-def format_expense_response(expense_doc) -> ExpenseResponse:
-    return ExpenseResponse(
-        id=expense_doc["id"],
-        description=expense_doc["description"],
-        amount=expense_doc["amount"],
-        category=expense_doc["category"],
-        date=expense_doc["date"],
-        created_at=expense_doc["created_at"]
-    )
+def to_utc_datetime(value: Date) -> datetime:
+    return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
 
-def get_current_month_filter():
-    now = datetime.now()
-    start_of_month = f"{now.year}-{now.month:02d}-01"
-    if now.month == 12:
-        end_of_month = f"{now.year + 1}-01-01"
+def build_expense_doc(expense: ExpenseCreate, created_at: datetime) -> dict:
+    return {
+        "description": expense.description,
+        "amount": expense.amount,
+        "category": expense.category,
+        "date": to_utc_datetime(expense.date),
+        "created_at": created_at
+    }
+
+def format_created_expense(expense_doc: dict, inserted_id: ObjectId) -> dict:
+    return {
+        "id": str(inserted_id),
+        "description": expense_doc["description"],
+        "amount": expense_doc["amount"],
+        "category": expense_doc["category"],
+        "date": expense_doc["date"].date().isoformat(),
+        "created_at": expense_doc["created_at"].isoformat(timespec="milliseconds")
+    }
+
+def expense_id_filter(expense_id: str) -> dict:
+    if not ObjectId.is_valid(expense_id):
+        raise HTTPException(status_code=404, detail="Despesa não encontrada")
+    return {"_id": ObjectId(expense_id)}
+
+@lru_cache(maxsize=2)
+def _month_bounds(year: int, month: int) -> dict:
+    # Shared between requests, callers must not mutate the returned filter
+    start_of_month = datetime(year, month, 1, tzinfo=timezone.utc)
+    if month == 12:
+        end_of_month = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
     else:
-        end_of_month = f"{now.year}-{now.month + 1:02d}-01"
+        end_of_month = datetime(year, month + 1, 1, tzinfo=timezone.utc)
     return {"date": {"$gte": start_of_month, "$lt": end_of_month}}
 
+def get_current_month_filter():
+    now = datetime.now()
+    return _month_bounds(now.year, now.month)
+
+def invalidate_dashboard_cache():
+    global _dashboard_generation
+    _dashboard_generation += 1
+    DASHBOARD_CACHE.clear()
+
+async def get_cached_dashboard(key: str, compute, expenses_collection: AsyncIOMotorCollection):
+    if DASHBOARD_CACHE_TTL <= 0:
+        return await compute(expenses_collection)
+    value = DASHBOARD_CACHE.get(key)
+    if value is None:
+        generation = _dashboard_generation
+        value = await compute(expenses_collection)
+        if generation == _dashboard_generation:
+            DASHBOARD_CACHE[key] = value
+    return value
+
+# Keyset pagination walks (created_at, _id) newest first; the cursor carries
+# both, as "<created_at in epoch milliseconds>_<id>", so rows created in the
+# same millisecond are not skipped and it can go in a URL unencoded
+PAGE_SORT = [("created_at", -1), ("_id", -1)]
+CURSOR_SEPARATOR = "_"
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def encode_cursor(expense: dict) -> str:
+    created_at = datetime.fromisoformat(expense["created_at"])
+    milliseconds = (created_at - EPOCH) // timedelta(milliseconds=1)
+    return f"{milliseconds}{CURSOR_SEPARATOR}{expense['id']}"
+
+def cursor_filter(cursor: str) -> dict:
+    milliseconds, _, expense_id = cursor.partition(CURSOR_SEPARATOR)
+    try:
+        created_at = EPOCH + timedelta(milliseconds=int(milliseconds))
+        expense_id = ObjectId(expense_id)
+    except (ValueError, OverflowError, InvalidId):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": expense_id}}
+    ]}
+
+# Endpoints a batch may call, matched against the normalised path; neither
+# nested batches nor bulk inserts are allowed
+BATCHABLE_PATH = re.compile(r"/api/(categories|expenses(/(?!bulk$)[^/]+)?|dashboard/(stats|categories))")
+
+def normalize_batch_path(path: str) -> str:
+    return re.sub(r"/{2,}", "/", path).rstrip("/")
+
+async def dispatch_batch_item(method: str, path: str, query: str, body: bytes) -> dict:
+    """Run one batched request through the app and collect its response"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": None,
+        "server": None
+    }
+    request_sent = False
+    response_done = asyncio.Event()
+    status = 500
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error handlers already answered with a 500; keep the traceback
+        logger.exception("Batched request %s %s failed", method, path)
+    content = b"".join(chunks)
+    try:
+        response_body = orjson.loads(content) if content else None
+    except orjson.JSONDecodeError:
+        response_body = content.decode("utf-8", errors="replace")
+    return {"status": status, "body": response_body}
+
+# Error handlers; HTTPException keeps FastAPI's own handler
+@app.exception_handler(PyMongoError)
+async def database_error_handler(request: Request, exc: PyMongoError):
+    logger.exception("Database error on %s %s", request.method, request.url.path, exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Erro no banco de dados"})
+
+@app.exception_handler(Exception)
+async def internal_error_handler(request: Request, exc: Exception):
+    return ORJSONResponse(status_code=500, content={"detail": "Erro interno"})
+
+# Startup
+@app.on_event("startup")
+async def convert_string_dates():
+    # Expenses written before dates were stored natively kept them as strings
+    expenses_collection = await get_expenses_collection()
+    await expenses_collection.update_many(
+        {"$or": [{"date": {"$type": "string"}}, {"created_at": {"$type": "string"}}]},
+        [{"$set": {
+            "date": {"$dateFromString": {"dateString": "$date", "onError": "$date"}},
+            "created_at": {"$dateFromString": {"dateString": "$created_at", "onError": "$created_at"}}
+        }}]
+    )
+
+@app.on_event("startup")
+async def create_indexes():
+    expenses_collection = await get_expenses_collection()
+    # Expenses used to carry a UUID `id`, now looked up through the _id index,
+    # and the list used to sort on created_at alone, then on (created_at, id)
+    for index_name in ("id_1", "created_at_-1", "created_at_-1_id_-1"):
+        try:
+            await expenses_collection.drop_index(index_name)
+        except OperationFailure:
+            pass
+    await expenses_collection.create_index("date", background=True)
+    await expenses_collection.create_index("category", background=True)
+    await expenses_collection.create_index(PAGE_SORT, background=True)
+    await expenses_collection.create_index([("date", 1), ("category", 1)], background=True)
+
 # API Endpoints
 @app.get("/")
 async def root():
     return {"message": "Gestão Financeira API - Sistema de controle de despesas"}
 
-@app.get("/api/categories", response_model=List[str])
+@app.get("/api/categories", response_model=None, responses={200: {"model": List[str]}})
 async def get_categories():
     """Get all available expense categories"""
-    return CATEGORIES
+    return Response(content=CATEGORIES_JSON, media_type="application/json")
 
 @app.post("/api/expenses", response_model=ExpenseResponse)
-async def create_expense(expense: ExpenseCreate):
+async def create_expense(expense: ExpenseCreate, expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection)):
     """Create a new expense"""
-    try:
-        # Validate category
-        if expense.category not in CATEGORIES:
-            raise HTTPException(status_code=400, detail="Categoria inválida")
-        
-        # Validate date format
-        try:
-            datetime.strptime(expense.date, "%Y-%m-%d")
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Formato de data inválido. Use YYYY-MM-DD")
-        
-        expense_doc = {
-            "id": str(uuid.uuid4()),
-            "description": expense.description,
-            "amount": expense.amount,
-            "category": expense.category,
-            "date": expense.date,
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        result = expenses_collection.insert_one(expense_doc)
-        if not result.inserted_id:
-            raise HTTPException(status_code=500, detail="Erro ao criar despesa")
-        
-        return format_expense_response(expense_doc)
+    expense_doc = build_expense_doc(expense, datetime.now(timezone.utc))
+    result = await expenses_collection.insert_one(expense_doc)
+    if not result.inserted_id:
+        raise HTTPException(status_code=500, detail="Erro ao criar despesa")
+    invalidate_dashboard_cache()
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
-
-@app.get("/api/expenses", response_model=List[ExpenseResponse])
-async def get_expenses(limit: int = 50, offset: int = 0):
-    """Get all expenses with pagination"""
+    return format_created_expense(expense_doc, result.inserted_id)
+
+@app.post("/api/expenses/bulk", response_model=List[ExpenseResponse], responses={207: {"model": BulkInsertPartial}})
+async def create_expenses_bulk(
+    expenses: List[ExpenseCreate] = Body(..., min_length=1, max_length=MAX_BULK_EXPENSES),
+    expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection),
+):
+    """Create several expenses in a single write
+
+    If some rows fail, the others are still stored: the response is then a
+    207 listing the created expenses and the indexes of the failed ones.
+    """
+    # One shared timestamp; the keyset cursor breaks the ties on _id
+    now = datetime.now(timezone.utc)
+    expense_docs = [build_expense_doc(expense, now) for expense in expenses]
     try:
-        cursor = expenses_collection.find().sort("created_at", -1).skip(offset).limit(limit)
-        expenses = []
-        for expense_doc in cursor:
-            expenses.append(format_expense_response(expense_doc))
-        return expenses
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao buscar despesas: {str(e)}")
-
-@app.get("/api/expenses/{expense_id}", response_model=ExpenseResponse)
-async def get_expense(expense_id: str):
+        result = await expenses_collection.insert_many(expense_docs, ordered=False)
+    except BulkWriteError as exc:
+        # insert_many assigned every document its _id before sending it
+        failed = {error["index"]: error["errmsg"] for error in exc.details.get("writeErrors", [])}
+        return ORJSONResponse(status_code=207, content={
+            "detail": "Algumas despesas não foram criadas",
+            "created": [
+                format_created_expense(expense_doc, expense_doc["_id"])
+                for position, expense_doc in enumerate(expense_docs) if position not in failed
+            ],
+            "failed": [{"index": index, "detail": detail} for index, detail in sorted(failed.items())]
+        })
+    finally:
+        # Part of the batch may be stored even when the insert raised
+        invalidate_dashboard_cache()
+    
+    return [
+        format_created_expense(expense_doc, inserted_id)
+        for expense_doc, inserted_id in zip(expense_docs, result.inserted_ids)
+    ]
+
+@app.get("/api/expenses", response_model=None, responses={200: {"model": List[ExpenseResponse]}})
+async def get_expenses(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    after: Optional[str] = None,
+    expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection),
+):
+    """Get all expenses with pagination
+
+    Pass the `X-Next-Cursor` header of a page as `after` to fetch the next one.
+    `offset` is still honoured when no cursor is given, but it walks every
+    skipped document.
+    """
+    if after is not None:
+        cursor = expenses_collection.find(cursor_filter(after), PROJECTION)
+    else:
+        cursor = expenses_collection.find({}, PROJECTION).skip(offset)
+    cursor = cursor.sort(PAGE_SORT).limit(limit)
+    expenses = await cursor.to_list(length=limit)
+    headers = {"X-Next-Cursor": encode_cursor(expenses[-1])} if expenses else None
+    # Documents already have the response shape, hand them straight to orjson
+    return ORJSONResponse(expenses, headers=headers)
+
+@app.get("/api/expenses/{expense_id}", response_model=None, responses={200: {"model": ExpenseResponse}})
+async def get_expense(expense_id: str, expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection)):
     """Get a specific expense by ID"""
-    try:
-        expense_doc = expenses_collection.find_one({"id": expense_id})
-        if not expense_doc:
-            raise HTTPException(status_code=404, detail="Despesa não encontrada")
-        return format_expense_response(expense_doc)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao buscar despesa: {str(e)}")
+    expense_doc = await expenses_collection.find_one(expense_id_filter(expense_id), PROJECTION)
+    if not expense_doc:
+        raise HTTPException(status_code=404, detail="Despesa não encontrada")
+    return ORJSONResponse(expense_doc)
 
 @app.put("/api/expenses/{expense_id}", response_model=ExpenseResponse)
-async def update_expense(expense_id: str, expense_update: ExpenseUpdate):
+async def update_expense(
+    expense_id: str,
+    expense_update: ExpenseUpdate,
+    expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection),
+):
     """Update an existing expense"""
-    try:
-        # Check if expense exists
-        existing = expenses_collection.find_one({"id": expense_id})
-        if not existing:
-            raise HTTPException(status_code=404, detail="Despesa não encontrada")
-        
-        # Prepare update data
-        update_data = {}
-        if expense_update.description is not None:
-            update_data["description"] = expense_update.description
-        if expense_update.amount is not None:
-            update_data["amount"] = expense_update.amount
-        if expense_update.category is not None:
-            if expense_update.category not in CATEGORIES:
-                raise HTTPException(status_code=400, detail="Categoria inválida")
-            update_data["category"] = expense_update.category
-        if expense_update.date is not None:
-            try:
-                datetime.strptime(expense_update.date, "%Y-%m-%d")
-                update_data["date"] = expense_update.date
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Formato de data inválido. Use YYYY-MM-DD")
-        
-        if not update_data:
-            raise HTTPException(status_code=400, detail="Nenhum dado para atualizar")
-        
-        # Update the expense
-        result = expenses_collection.update_one(
-            {"id": expense_id},
-            {"$set": update_data}
-        )
-        
-        if result.modified_count == 0:
-            raise HTTPException(status_code=500, detail="Erro ao atualizar despesa")
-        
-        # Return updated expense
-        updated_expense = expenses_collection.find_one({"id": expense_id})
-        return format_expense_response(updated_expense)
+    # Prepare update data
+    update_data = {}
+    if expense_update.description is not None:
+        update_data["description"] = expense_update.description
+    if expense_update.amount is not None:
+        update_data["amount"] = expense_update.amount
+    if expense_update.category is not None:
+        update_data["category"] = expense_update.category
+    if expense_update.date is not None:
+        update_data["date"] = to_utc_datetime(expense_update.date)
+    
+    if not update_data:
+        raise HTTPException(status_code=400, detail="Nenhum dado para atualizar")
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    # Update and return the expense in a single round trip
+    updated_expense = await expenses_collection.find_one_and_update(
+        expense_id_filter(expense_id),
+        {"$set": update_data},
+        projection=PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_expense:
+        raise HTTPException(status_code=404, detail="Despesa não encontrada")
+    invalidate_dashboard_cache()
+    return updated_expense
 
 @app.delete("/api/expenses/{expense_id}")
-async def delete_expense(expense_id: str):
+async def delete_expense(expense_id: str, expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection)):
     """Delete an expense"""
-    try:
-        result = expenses_collection.delete_one({"id": expense_id})
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Despesa não encontrada")
-        return {"message": "Despesa excluída com sucesso"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao excluir despesa: {str(e)}")
+    result = await expenses_collection.delete_one(expense_id_filter(expense_id))
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Despesa não encontrada")
+    invalidate_dashboard_cache()
+    return {"message": "Despesa excluída com sucesso"}
+
+@app.post("/api/batch", response_model=None, responses={200: {"model": BatchResponse}})
+async def run_batch(batch: BatchRequest):
+    """Run several API requests in one round trip, in the order given"""
+    prepared = []
+    for item in batch.requests:
+        raw_path, _, query = item.path.partition("?")
+        path = normalize_batch_path(raw_path)
+        if path == "/api/batch":
+            raise HTTPException(status_code=400, detail="Requisições em lote não podem ser aninhadas")
+        if not BATCHABLE_PATH.fullmatch(path):
+            raise HTTPException(status_code=400, detail=f"Caminho não permitido em lote: {item.path}")
+        body = orjson.dumps(item.body) if item.body is not None else b""
+        prepared.append((item.method, path, query, body))
+    if sum(len(body) for _, _, _, body in prepared) > MAX_BATCH_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Lote excede o tamanho máximo")
+    responses = [await dispatch_batch_item(*request) for request in prepared]
+    return ORJSONResponse({"responses": responses})
 
 @app.get("/api/dashboard/stats", response_model=DashboardStats)
-async def get_dashboard_stats():
+async def get_dashboard_stats(expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection)):
     """Get dashboard statistics"""
-    try:
-        # Get all expenses
-        all_expenses = list(expenses_collection.find())
-        
-        if not all_expenses:
-            return DashboardStats(
-                total_expenses=0.0,
-                total_count=0,
-                average_expense=0.0,
-                categories_used=0,
-                monthly_total=0.0
-            )
-        
-        # Calculate totals
-        total_expenses = sum(exp["amount"] for exp in all_expenses)
-        total_count = len(all_expenses)
-        average_expense = total_expenses / total_count if total_count > 0 else 0.0
-        
-        # Get unique categories
-        categories_used = len(set(exp["category"] for exp in all_expenses))
-        
-        # Calculate monthly total (current month)
-        current_month_filter = get_current_month_filter()
-        monthly_expenses = list(expenses_collection.find(current_month_filter))
-        monthly_total = sum(exp["amount"] for exp in monthly_expenses)
-        
+    return await get_cached_dashboard("stats", compute_dashboard_stats, expenses_collection)
+
+async def compute_dashboard_stats(expenses_collection: AsyncIOMotorCollection) -> DashboardStats:
+    current_month_filter = get_current_month_filter()
+    pipeline = [
+        {"$facet": {
+            "overall": [
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": "$amount"},
+                    "count": {"$sum": 1},
+                    "categories": {"$addToSet": "$category"}
+                }},
+                {"$project": {"total": 1, "count": 1, "categories_used": {"$size": "$categories"}}}
+            ],
+            "monthly": [
+                {"$match": current_month_filter},
+                {"$group": {"_id": None, "monthly_total": {"$sum": "$amount"}}}
+            ]
+        }}
+    ]
+    # The displayed all-time count comes from collection metadata; the average
+    # uses the exact count of the rows that were summed
+    result, total_count = await asyncio.gather(
+        expenses_collection.aggregate(pipeline).to_list(length=1),
+        expenses_collection.estimated_document_count()
+    )
+    overall = result[0]["overall"]
+    monthly = result[0]["monthly"]
+    
+    if not overall:
         return DashboardStats(
-            total_expenses=total_expenses,
-            total_count=total_count,
-            average_expense=average_expense,
-            categories_used=categories_used,
-            monthly_total=monthly_total
+            total_expenses=0.0,
+            total_count=0,
+            average_expense=0.0,
+            categories_used=0,
+            monthly_total=0.0
         )
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao calcular estatísticas: {str(e)}")
+    total_expenses = overall[0]["total"]
+    average_expense = total_expenses / overall[0]["count"]
+    
+    return DashboardStats(
+        total_expenses=total_expenses,
+        total_count=total_count,
+        average_expense=average_expense,
+        categories_used=overall[0]["categories_used"],
+        monthly_total=monthly[0]["monthly_total"] if monthly else 0.0
+    )
 
-@app.get("/api/dashboard/categories", response_model=List[CategorySummary])
-async def get_category_summaries():
+@app.get("/api/dashboard/categories", response_model=None, responses={200: {"model": List[CategorySummary]}})
+async def get_category_summaries(expenses_collection: AsyncIOMotorCollection = Depends(get_expenses_collection)):
     """Get expense summaries by category for current month"""
-    try:
-        current_month_filter = get_current_month_filter()
-        monthly_expenses = list(expenses_collection.find(current_month_filter))
-        
-        if not monthly_expenses:
-            return []
-        
+    summaries = await get_cached_dashboard("categories", compute_category_summaries, expenses_collection)
+    return ORJSONResponse(summaries)
+
+async def compute_category_summaries(expenses_collection: AsyncIOMotorCollection) -> List[dict]:
+    current_month_filter = get_current_month_filter()
+    pipeline = [
+        {"$match": current_month_filter},
         # Group by category
-        category_totals = defaultdict(lambda: {"total": 0.0, "count": 0})
-        total_amount = 0.0
-        
-        for expense in monthly_expenses:
-            category = expense["category"]
-            amount = expense["amount"]
-            category_totals[category]["total"] += amount
-            category_totals[category]["count"] += 1
-            total_amount += amount
-        
-        # Create summaries
-        summaries = []
-        for category, data in category_totals.items():
-            percentage = (data["total"] / total_amount * 100) if total_amount > 0 else 0
-            summaries.append(CategorySummary(
-                category=category,
-                total=data["total"],
-                count=data["count"],
-                percentage=percentage
-            ))
-        
+        {"$group": {"_id": "$category", "total": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+        # Collect the groups once more to get the month's grand total
+        {"$group": {"_id": None, "total_amount": {"$sum": "$total"}, "categories": {"$push": "$$ROOT"}}},
+        {"$unwind": "$categories"},
+        {"$project": {
+            "_id": 0,
+            "category": "$categories._id",
+            "total": "$categories.total",
+            "count": "$categories.count",
+            "percentage": {"$cond": [
+                {"$gt": ["$total_amount", 0]},
+                {"$multiply": [{"$divide": ["$categories.total", "$total_amount"]}, 100]},
+                0
+            ]}
+        }},
         # Sort by total descending
-        summaries.sort(key=lambda x: x.total, reverse=True)
-        return summaries
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao calcular resumo por categoria: {str(e)}")
+        {"$sort": {"total": -1}}
+    ]
+    return await expenses_collection.aggregate(pipeline).to_list(length=None)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Import string form so uvicorn can spawn worker processes
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1)))
+    )
\ No newline at end of file
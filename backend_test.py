@@ -1,24 +1,144 @@
 #!/usr/bin/env python3
-import requests
-import json
+import asyncio
+import copy
+import functools
 import datetime
 import time
 import os
+import pathlib
+import re
 import sys
 from typing import Dict, List, Any, Optional
 
-# Get the backend URL from the frontend .env file
+# Get the backend URL from the environment or the frontend .env file
+@functools.lru_cache(maxsize=1)
 def get_backend_url():
-    with open('/app/frontend/.env', 'r') as f:
-        for line in f:
-            if line.startswith('REACT_APP_BACKEND_URL='):
-                return line.strip().split('=')[1].strip('"\'')
+    if url := os.environ.get('REACT_APP_BACKEND_URL'):
+        return url
+    for line in pathlib.Path('/app/frontend/.env').read_text().splitlines():
+        if line.startswith('REACT_APP_BACKEND_URL='):
+            return line.strip().split('=')[1].strip('"\'')
     raise Exception("Could not find REACT_APP_BACKEND_URL in frontend/.env")
 
+# pytest collects this file (it matches *_test.py); the tests talk to a
+# running backend, so without one configured there is nothing to run
+if "pytest" in sys.modules:
+    import pytest
+    try:
+        get_backend_url()
+    except Exception:
+        pytest.skip("REACT_APP_BACKEND_URL is not configured", allow_module_level=True)
+
+import httpx
+from cachetools import TTLCache
+
+try:
+    import orjson
+    dump_json, load_json = orjson.dumps, orjson.loads
+except ImportError:  # fall back to the standard library encoder
+    import json
+    def dump_json(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    load_json = json.loads
+
+try:
+    import pytest
+    import pytest_asyncio
+except ImportError:  # only needed to run the tests under pytest
+    pytest = pytest_asyncio = None
+
 # Base URL for API requests
-BASE_URL = f"{get_backend_url()}/api"
+API_PREFIX = "/api"
+BASE_URL = f"{get_backend_url()}{API_PREFIX}"
 print(f"Using backend URL: {BASE_URL}")
 
+# Date used for every test expense (YYYY-MM-DD)
+TODAY = datetime.date.today().isoformat()
+
+# Fields every response of the given kind must carry
+EXPENSE_FIELDS = frozenset({"id", "description", "amount", "category", "date", "created_at"})
+DASHBOARD_STATS_FIELDS = frozenset({"total_expenses", "total_count", "average_expense", "categories_used", "monthly_total"})
+CATEGORY_SUMMARY_FIELDS = frozenset({"category", "total", "count", "percentage"})
+EXPECTED_CATEGORIES = frozenset({
+    "Alimentação", "Transporte", "Lazer", "Saúde", "Educação",
+    "Casa", "Roupas", "Tecnologia", "Outros"
+})
+
+# Pydantic error types a 422 body must carry for each kind of invalid value;
+# field names alone would match the `loc` of any error on that field
+CATEGORY_NEEDLES = ("literal_error",)
+AMOUNT_NEEDLES = ("greater_than",)
+DATE_NEEDLES = ("date_parsing", "date_from_datetime_parsing")
+DESCRIPTION_NEEDLES = ("string_too_short",)
+# Detail of the API's 404s
+NOT_FOUND_NEEDLES = ("não encontrada", "not found")
+
+# Defaults for test expense payloads
+_BASE_EXPENSE = {"description": "", "amount": 0.0, "category": "Alimentação", "date": TODAY}
+
+# A well-formed ObjectId no expense has, which reaches the database lookup,
+# and an id the server rejects before querying
+MISSING_EXPENSE_ID = "000000000000000000000000"
+MALFORMED_EXPENSE_ID = "00000000-0000-0000-0000-000000000000"
+
+# Characters that survive a query string without percent-encoding
+URL_SAFE = re.compile(r"[A-Za-z0-9._~-]+")
+
+# Size bounds of POST /api/expenses/bulk
+MAX_BULK_EXPENSES = 1000
+
+# Limit on the sub-request bodies of one POST /api/batch, in bytes
+MAX_BATCH_BODY_BYTES = 256 * 1024
+
+# Categories cycled through by the pagination fixtures
+PAGINATION_CATEGORIES = ("Alimentação", "Transporte", "Lazer")
+
+def make_expense(**overrides) -> Dict:
+    """Build an expense payload from the defaults and the given fields"""
+    return {**_BASE_EXPENSE, **overrides}
+
+# Expenses shared by the read, update and delete tests, created once by
+# setup_fixtures; the update and delete tests get their own copies so the
+# baseline stays untouched while the tests run concurrently
+BASELINE_EXPENSE = make_expense(description="Despesa para Busca por ID", amount=200.0, category="Saúde")
+FIXTURE_EXPENSES = {
+    "baseline": BASELINE_EXPENSE,
+    "update": {**BASELINE_EXPENSE, "description": "Despesa para Atualização"},
+    "delete": {**BASELINE_EXPENSE, "description": "Despesa para Exclusão"}
+}
+
+# Created fixture expenses, keyed like FIXTURE_EXPENSES
+FIXTURES: Dict[str, Dict] = {}
+
+# Connection limits for the shared client; with HTTP/2 requests to the
+# backend are multiplexed over a single connection
+LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Transient failures retried with exponential backoff (0.2s, 0.4s, 0.8s);
+# connection errors are already retried by the transport. Only idempotent
+# methods are retried: a POST that timed out may have been stored already
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.2
+
+# Parsed GET responses of CACHED_ENDPOINTS, keyed on (endpoint, params).
+# Writes drop the ones in WRITE_INVALIDATED_ENDPOINTS; the category list is
+# fixed on the server, so no write can change it
+CACHED_ENDPOINTS = frozenset({"/categories", "/dashboard/categories"})
+WRITE_INVALIDATED_ENDPOINTS = frozenset({"/dashboard/categories"})
+GET_CACHE = TTLCache(maxsize=128, ttl=30)
+_cache_generation = 0
+
+def invalidate_get_cache():
+    global _cache_generation
+    _cache_generation += 1
+    for key in [key for key in GET_CACHE if key[0] in WRITE_INVALIDATED_ENDPOINTS]:
+        GET_CACHE.pop(key, None)
+
+# Separator line framing each test's output
+_BAR = "=" * 80 + "\n"
+
 # Test results tracking
 test_results = {
     "total_tests": 0,
@@ -27,21 +147,20 @@ test_results = {
     "test_details": []
 }
 
-# Helper function to run a test and track results
-def run_test(test_name: str, test_func, *args, **kwargs):
+# Helper function to run a test and track results; returns whether it passed
+async def run_test(test_name: str, test_func, *args, **kwargs):
     test_results["total_tests"] += 1
-    print(f"\n{'='*80}\nRunning test: {test_name}\n{'='*80}")
+    sys.stdout.write(f"\n{_BAR}Running test: {test_name}\n{_BAR}")
     
     try:
-        result = test_func(*args, **kwargs)
+        await test_func(*args, **kwargs)
         test_results["passed_tests"] += 1
         test_results["test_details"].append({
             "name": test_name,
-            "status": "PASSED",
-            "details": result
+            "status": "PASSED"
         })
-        print(f"✅ Test PASSED: {test_name}")
-        return result
+        sys.stdout.write(f"✅ Test PASSED: {test_name}\n")
+        return True
     except Exception as e:
         test_results["failed_tests"] += 1
         test_results["test_details"].append({
@@ -49,90 +168,137 @@ def run_test(test_name: str, test_func, *args, **kwargs):
             "status": "FAILED",
             "details": str(e)
         })
-        print(f"❌ Test FAILED: {test_name}")
-        print(f"Error: {str(e)}")
-        return None
+        sys.stdout.write(f"❌ Test FAILED: {test_name}\nError: {str(e)}\n")
+        return False
+
+# Helper function to send a request, retrying gateway errors and timeouts
+async def send_request(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> httpx.Response:
+    method = method.upper()
+    content = None if data is None else dump_json(data)
+    retries = MAX_RETRIES if method in RETRY_METHODS else 0
+    for attempt in range(retries + 1):
+        try:
+            response = await client.request(method, endpoint, content=content, params=params)
+        except httpx.TimeoutException:
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
 
 # Helper function to make API requests
-def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None):
-    url = f"{BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+async def make_request(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None):
+    method = method.upper()
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    cacheable = method == "GET" and endpoint in CACHED_ENDPOINTS
+    cache_key = (endpoint, frozenset(params.items()) if params else None)
+    if cacheable and cache_key in GET_CACHE:
+        # A copy, so a caller changing its result cannot corrupt later hits
+        return copy.deepcopy(GET_CACHE[cache_key])
+    generation = _cache_generation
     
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, params=params, headers=headers)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers)
-        elif method.upper() == "PUT":
-            response = requests.put(url, json=data, headers=headers)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+        response = await send_request(client, method, endpoint, data=data, params=params)
         
         # Check if the request was successful
         response.raise_for_status()
         
         # Return JSON response if available, otherwise return response object
-        try:
-            return response.json()
-        except:
-            return response
+        if "application/json" in response.headers.get("content-type", ""):
+            result = load_json(response.content)
+        else:
+            result = response
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Request failed: {e}")
-        if hasattr(e, 'response') and e.response is not None:
+        if isinstance(e, httpx.HTTPStatusError):
+            body = e.response.content
             try:
-                error_detail = e.response.json()
-                print(f"Response error: {error_detail}")
-                raise Exception(f"API Error: {error_detail}")
-            except:
+                error_detail = load_json(body)
+            except ValueError:
+                # Not JSON: decode the raw bytes once, only to report them
+                text = body.decode("utf-8", errors="replace")
                 print(f"Response status code: {e.response.status_code}")
-                print(f"Response text: {e.response.text}")
-                raise Exception(f"API Error: {e.response.status_code} - {e.response.text}")
+                print(f"Response text: {text}")
+                raise Exception(f"API Error: {e.response.status_code} - {text}") from e
+            print(f"Response error: {error_detail}")
+            raise Exception(f"API Error: {error_detail}") from e
         raise Exception(f"Request failed: {str(e)}")
+    finally:
+        if method != "GET":
+            invalidate_get_cache()
+    
+    # Skip caching if a write went out while this GET was in flight
+    if cacheable and generation == _cache_generation:
+        GET_CACHE[cache_key] = copy.deepcopy(result)
+    return result
+
+# Helper function to make API requests that are expected to fail; never raises on 4xx/5xx
+async def request_raw(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None):
+    """Return (status_code, body), with body parsed as JSON when the server sent JSON"""
+    response = await send_request(client, method, endpoint, data=data, params=params)
+    if "application/json" in response.headers.get("content-type", ""):
+        return response.status_code, load_json(response.content)
+    return response.status_code, response.text
+
+# Helper to check an error response's status code and that its body mentions one of the needles
+def assert_http_error(status: int, body: Any, expected_status: int, *needles: str):
+    if status != expected_status:
+        raise Exception(f"Expected status {expected_status}, got {status}: {body}")
+    if not any(needle in str(body).lower() for needle in needles):
+        raise Exception(f"Expected error related to {'/'.join(needles)}, got: {body}")
+
+# Helper function to send several requests through POST /api/batch
+async def make_batch(client: httpx.AsyncClient, requests: List[Dict]) -> List[Dict]:
+    """Return one {"status", "body"} entry per request, in order"""
+    batch = [{**request, "path": f"{API_PREFIX}{request['path']}"} for request in requests]
+    response = await make_request(client, "POST", "/batch", data={"requests": batch})
+    return response["responses"]
+
+# Helper function to create several expenses in one batched call
+async def create_expenses(client: httpx.AsyncClient, payloads: List[Dict]) -> List[Dict]:
+    responses = await make_batch(client, [{"method": "POST", "path": "/expenses", "body": data} for data in payloads])
+    for response in responses:
+        if response["status"] != 200:
+            raise Exception(f"API Error: {response['status']} - {response['body']}")
+    return [response["body"] for response in responses]
+
+# Create the shared fixture expenses in one batched call
+async def setup_fixtures(client: httpx.AsyncClient):
+    created = await create_expenses(client, list(FIXTURE_EXPENSES.values()))
+    FIXTURES.update(zip(FIXTURE_EXPENSES, created))
 
 # Test functions for each API endpoint
 
-def test_get_categories():
+async def test_get_categories(client: httpx.AsyncClient):
     """Test the GET /api/categories endpoint"""
-    response = make_request("GET", "/categories")
+    response = await make_request(client, "GET", "/categories")
     
     # Verify the response contains the expected categories
-    expected_categories = [
-        "Alimentação", "Transporte", "Lazer", "Saúde", "Educação", 
-        "Casa", "Roupas", "Tecnologia", "Outros"
-    ]
-    
     if not isinstance(response, list):
         raise Exception(f"Expected a list of categories, got {type(response)}")
     
-    if len(response) != len(expected_categories):
-        raise Exception(f"Expected {len(expected_categories)} categories, got {len(response)}")
+    if len(response) != len(EXPECTED_CATEGORIES):
+        raise Exception(f"Expected {len(EXPECTED_CATEGORIES)} categories, got {len(response)}")
     
-    for category in expected_categories:
-        if category not in response:
-            raise Exception(f"Expected category '{category}' not found in response")
-    
-    return {"categories": response}
+    missing = EXPECTED_CATEGORIES - frozenset(response)
+    if missing:
+        raise Exception(f"Expected categories {sorted(missing)} not found in response")
 
-def test_create_expense():
+async def test_create_expense(client: httpx.AsyncClient):
     """Test the POST /api/expenses endpoint"""
     # Create a valid expense
-    expense_data = {
-        "description": "Teste de Despesa",
-        "amount": 150.75,
-        "category": "Alimentação",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
+    expense_data = make_expense(description="Teste de Despesa", amount=150.75)
     
-    response = make_request("POST", "/expenses", data=expense_data)
+    response = await make_request(client, "POST", "/expenses", data=expense_data)
     
     # Verify the response contains the expected fields
-    required_fields = ["id", "description", "amount", "category", "date", "created_at"]
-    for field in required_fields:
-        if field not in response:
-            raise Exception(f"Required field '{field}' not found in response")
+    missing = EXPENSE_FIELDS - response.keys()
+    if missing:
+        raise Exception(f"Required fields {sorted(missing)} not found in response")
     
     # Verify the data matches what we sent
     if response["description"] != expense_data["description"]:
@@ -146,107 +312,113 @@ def test_create_expense():
     
     if response["date"] != expense_data["date"]:
         raise Exception(f"Date mismatch: expected '{expense_data['date']}', got '{response['date']}'")
-    
-    return {"created_expense": response}
 
-def test_create_expense_validations():
+async def test_create_expense_validations(client: httpx.AsyncClient):
     """Test validations for the POST /api/expenses endpoint"""
     # Test invalid category
-    invalid_category_data = {
-        "description": "Despesa com Categoria Inválida",
-        "amount": 100.0,
-        "category": "Categoria Inválida",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    try:
-        make_request("POST", "/expenses", data=invalid_category_data)
-        raise Exception("Expected validation error for invalid category, but request succeeded")
-    except Exception as e:
-        if "Categoria inválida" not in str(e):
-            raise Exception(f"Expected 'Categoria inválida' error, got: {str(e)}")
+    invalid_category_data = make_expense(description="Despesa com Categoria Inválida", amount=100.0, category="Categoria Inválida")
     
     # Test negative amount
-    negative_amount_data = {
-        "description": "Despesa com Valor Negativo",
-        "amount": -50.0,
-        "category": "Alimentação",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    try:
-        make_request("POST", "/expenses", data=negative_amount_data)
-        raise Exception("Expected validation error for negative amount, but request succeeded")
-    except Exception as e:
-        if "amount" not in str(e).lower() and "valor" not in str(e).lower():
-            raise Exception(f"Expected error related to amount/valor, got: {str(e)}")
+    negative_amount_data = make_expense(description="Despesa com Valor Negativo", amount=-50.0)
     
     # Test invalid date format
-    invalid_date_data = {
-        "description": "Despesa com Data Inválida",
-        "amount": 75.0,
-        "category": "Alimentação",
-        "date": "01/01/2023"  # Wrong format, should be YYYY-MM-DD
-    }
-    
-    try:
-        make_request("POST", "/expenses", data=invalid_date_data)
-        raise Exception("Expected validation error for invalid date format, but request succeeded")
-    except Exception as e:
-        if "data" not in str(e).lower() and "date" not in str(e).lower():
-            raise Exception(f"Expected error related to date/data, got: {str(e)}")
+    invalid_date_data = make_expense(description="Despesa com Data Inválida", amount=75.0, date="01/01/2023")  # Wrong format, should be YYYY-MM-DD
     
     # Test empty description
-    empty_description_data = {
-        "description": "",
-        "amount": 100.0,
-        "category": "Alimentação",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    try:
-        make_request("POST", "/expenses", data=empty_description_data)
-        raise Exception("Expected validation error for empty description, but request succeeded")
-    except Exception as e:
-        if "description" not in str(e).lower() and "descrição" not in str(e).lower():
-            raise Exception(f"Expected error related to description/descrição, got: {str(e)}")
-    
-    return {"validation_tests": "All validation tests passed"}
+    empty_description_data = make_expense(description="", amount=100.0)
+    
+    # Send the invalid expenses in one batched round trip
+    responses = await make_batch(client, [
+        {"method": "POST", "path": "/expenses", "body": data}
+        for data in (invalid_category_data, negative_amount_data, invalid_date_data, empty_description_data)
+    ])
+    expected_errors = (CATEGORY_NEEDLES, AMOUNT_NEEDLES, DATE_NEEDLES, DESCRIPTION_NEEDLES)
+    for needles, response in zip(expected_errors, responses):
+        assert_http_error(response["status"], response["body"], 422, *needles)
+
+async def test_create_expenses_bulk(client: httpx.AsyncClient):
+    """Test the POST /api/expenses/bulk endpoint"""
+    payloads = [
+        make_expense(description=f"Despesa em Lote {i+1}", amount=20.0 + i, category=category)
+        for i, category in enumerate(PAGINATION_CATEGORIES)
+    ]
+    response = await make_request(client, "POST", "/expenses/bulk", data=payloads)
+    
+    if not isinstance(response, list) or len(response) != len(payloads):
+        raise Exception(f"Expected {len(payloads)} created expenses, got: {response}")
+    
+    # One response per payload, in request order
+    for expense, payload in zip(response, payloads):
+        missing = EXPENSE_FIELDS - expense.keys()
+        if missing:
+            raise Exception(f"Required fields {sorted(missing)} not found in response")
+        mismatched = {field for field in payload if expense[field] != payload[field]}
+        if mismatched:
+            raise Exception(f"Fields {sorted(mismatched)} do not match the payload: {expense}")
+    
+    # Ids follow the insertion order; that is what orders rows sharing a created_at
+    ids = [expense["id"] for expense in response]
+    if len(set(ids)) != len(ids) or ids != sorted(ids):
+        raise Exception(f"Expected distinct ids in insertion order, got {ids}")
+    
+    # Every expense was stored
+    stored = await make_batch(client, [{"method": "GET", "path": f"/expenses/{expense_id}"} for expense_id in ids])
+    missing_ids = [expense_id for expense_id, item in zip(ids, stored) if item["status"] != 200]
+    if missing_ids:
+        raise Exception(f"Bulk-created expenses {missing_ids} not found")
+    
+    # Between 1 and MAX_BULK_EXPENSES expenses per call
+    for count in (0, MAX_BULK_EXPENSES + 1):
+        status, body = await request_raw(client, "POST", "/expenses/bulk", data=[make_expense(description="Despesa", amount=1.0)] * count)
+        assert_http_error(status, body, 422, "list")
 
-def test_get_expenses():
+async def test_batch_validation(client: httpx.AsyncClient):
+    """Test the requests POST /api/batch refuses"""
+    # Nested batches, however the path is spelled, and bulk inserts
+    for path in ("/api/batch", "/api/batch/", "/api//batch", "/api/batch?x=1"):
+        status, body = await request_raw(client, "POST", "/batch", data={"requests": [{"method": "POST", "path": path, "body": {"requests": []}}]})
+        assert_http_error(status, body, 400, "aninhadas")
+    status, body = await request_raw(client, "POST", "/batch", data={"requests": [{"method": "POST", "path": "/api/expenses/bulk", "body": [make_expense(description="Despesa", amount=1.0)]}]})
+    assert_http_error(status, body, 400, "não permitido")
+    
+    # Methods and paths outside the BatchItem schema
+    status, body = await request_raw(client, "POST", "/batch", data={"requests": [{"method": "PATCH", "path": "/api/expenses"}]})
+    assert_http_error(status, body, 422, "method")
+    status, body = await request_raw(client, "POST", "/batch", data={"requests": [{"method": "GET", "path": "/expenses"}]})
+    assert_http_error(status, body, 422, "path")
+    
+    # Sub-request bodies over the size cap
+    oversized = make_expense(description="x" * (MAX_BATCH_BODY_BYTES + 1), amount=1.0)
+    status, body = await request_raw(client, "POST", "/batch", data={"requests": [{"method": "POST", "path": "/api/expenses", "body": oversized}]})
+    assert_http_error(status, body, 413, "tamanho")
+
+async def test_get_expenses(client: httpx.AsyncClient):
     """Test the GET /api/expenses endpoint with pagination"""
     # Create multiple expenses for testing pagination
-    expenses = []
-    categories = ["Alimentação", "Transporte", "Lazer"]
-    
-    for i in range(3):
-        expense_data = {
-            "description": f"Despesa de Teste {i+1}",
-            "amount": 100.0 + (i * 50),
-            "category": categories[i % len(categories)],
-            "date": datetime.datetime.now().strftime("%Y-%m-%d")
-        }
-        
-        response = make_request("POST", "/expenses", data=expense_data)
-        expenses.append(response)
+    payloads = [
+        make_expense(
+            description=f"Despesa de Teste {i+1}",
+            amount=100.0 + (i * 50),
+            category=PAGINATION_CATEGORIES[i % len(PAGINATION_CATEGORIES)]
+        )
+        for i in range(3)
+    ]
+    expenses = await create_expenses(client, payloads)
     
     # Test default pagination (limit=50, offset=0)
-    response = make_request("GET", "/expenses")
+    response = await make_request(client, "GET", "/expenses")
     
     if not isinstance(response, list):
         raise Exception(f"Expected a list of expenses, got {type(response)}")
     
     # Verify that our created expenses are in the response
-    expense_ids = [expense["id"] for expense in expenses]
-    response_ids = [expense["id"] for expense in response]
-    
-    for expense_id in expense_ids:
-        if expense_id not in response_ids:
-            raise Exception(f"Created expense with ID {expense_id} not found in response")
+    missing = {expense["id"] for expense in expenses} - {expense["id"] for expense in response}
+    if missing:
+        raise Exception(f"Created expenses with IDs {sorted(missing)} not found in response")
     
     # Test pagination with limit
     limit = 2
-    response_limited = make_request("GET", "/expenses", params={"limit": limit})
+    response_limited = await make_request(client, "GET", "/expenses", params={"limit": limit})
     
     if not isinstance(response_limited, list):
         raise Exception(f"Expected a list of expenses, got {type(response_limited)}")
@@ -256,7 +428,7 @@ def test_get_expenses():
     
     # Test pagination with offset
     offset = 1
-    response_offset = make_request("GET", "/expenses", params={"offset": offset, "limit": limit})
+    response_offset = await make_request(client, "GET", "/expenses", params={"offset": offset, "limit": limit})
     
     if not isinstance(response_offset, list):
         raise Exception(f"Expected a list of expenses, got {type(response_offset)}")
@@ -269,32 +441,59 @@ def test_get_expenses():
         if response[offset]["id"] != response_offset[0]["id"]:
             raise Exception(f"Offset pagination not working correctly")
     
-    return {
-        "created_expenses": expenses,
-        "pagination_tests": "All pagination tests passed"
-    }
+    # Out-of-range page parameters are rejected instead of reaching the database
+    for params in ({"limit": 0}, {"limit": -1}, {"offset": -1}):
+        status, body = await request_raw(client, "GET", "/expenses", params=params)
+        assert_http_error(status, body, 422, *params)
+
+async def test_get_expenses_cursor(client: httpx.AsyncClient):
+    """Test walking GET /api/expenses pages through the X-Next-Cursor header"""
+    # Batched creates run back to back, so several usually share a millisecond
+    payloads = [make_expense(description=f"Despesa do Cursor {i+1}", amount=10.0 + i) for i in range(5)]
+    created_ids = {expense["id"] for expense in await create_expenses(client, payloads)}
+    
+    # Walk two items at a time until every created expense has been seen
+    seen_ids = []
+    previous_key = None
+    endpoint = "/expenses?limit=2"
+    while not created_ids <= set(seen_ids):
+        response = await send_request(client, "GET", endpoint)
+        response.raise_for_status()
+        page = load_json(response.content)
+        if not page:
+            raise Exception(f"Ran out of pages before seeing {sorted(created_ids - set(seen_ids))}")
+        for expense in page:
+            # Newest first, ties broken by id
+            key = (expense["created_at"], expense["id"])
+            if previous_key is not None and key >= previous_key:
+                raise Exception(f"Page order broken: {key} came after {previous_key}")
+            previous_key = key
+            seen_ids.append(expense["id"])
+        # Pasted into the URL as is, the way a client would, without encoding it
+        cursor = response.headers["X-Next-Cursor"]
+        if not URL_SAFE.fullmatch(cursor):
+            raise Exception(f"Cursor {cursor!r} is not URL-safe")
+        endpoint = f"/expenses?limit=2&after={cursor}"
+    
+    if len(seen_ids) != len(set(seen_ids)):
+        raise Exception(f"Cursor pagination returned duplicates: {seen_ids}")
+    
+    # A cursor that does not parse is a client error
+    status, body = await request_raw(client, "GET", "/expenses", params={"after": "not-a-cursor"})
+    assert_http_error(status, body, 400, "cursor")
 
-def test_get_expense_by_id():
+async def test_get_expense_by_id(client: httpx.AsyncClient):
     """Test the GET /api/expenses/{id} endpoint"""
-    # Create an expense first
-    expense_data = {
-        "description": "Despesa para Busca por ID",
-        "amount": 200.0,
-        "category": "Saúde",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    created_expense = make_request("POST", "/expenses", data=expense_data)
-    expense_id = created_expense["id"]
+    expense_data = BASELINE_EXPENSE
+    expense_id = FIXTURES["baseline"]["id"]
     
     # Get the expense by ID
-    response = make_request("GET", f"/expenses/{expense_id}")
+    response = await make_request(client, "GET", f"/expenses/{expense_id}")
     
     # Verify the response contains the expected fields
-    required_fields = ["id", "description", "amount", "category", "date", "created_at"]
-    for field in required_fields:
-        if field not in response:
-            raise Exception(f"Required field '{field}' not found in response")
+    missing = EXPENSE_FIELDS - response.keys()
+    if missing:
+        raise Exception(f"Required fields {sorted(missing)} not found in response")
     
     # Verify the data matches what we created
     if response["id"] != expense_id:
@@ -312,44 +511,29 @@ def test_get_expense_by_id():
     if response["date"] != expense_data["date"]:
         raise Exception(f"Date mismatch: expected '{expense_data['date']}', got '{response['date']}'")
     
-    # Test with non-existent ID
-    non_existent_id = "00000000-0000-0000-0000-000000000000"
-    try:
-        make_request("GET", f"/expenses/{non_existent_id}")
-        raise Exception(f"Expected 404 error for non-existent ID, but request succeeded")
-    except Exception as e:
-        if "não encontrada" not in str(e).lower() and "not found" not in str(e).lower():
-            raise Exception(f"Expected 'not found' error, got: {str(e)}")
-    
-    return {"expense_by_id": response}
+    # Test with a non-existent ID, and with one that is not an ObjectId
+    for unknown_id in (MISSING_EXPENSE_ID, MALFORMED_EXPENSE_ID):
+        status, body = await request_raw(client, "GET", f"/expenses/{unknown_id}")
+        assert_http_error(status, body, 404, *NOT_FOUND_NEEDLES)
 
-def test_update_expense():
+async def test_update_expense(client: httpx.AsyncClient):
     """Test the PUT /api/expenses/{id} endpoint"""
-    # Create an expense first
-    expense_data = {
-        "description": "Despesa para Atualização",
-        "amount": 300.0,
-        "category": "Educação",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    created_expense = make_request("POST", "/expenses", data=expense_data)
-    expense_id = created_expense["id"]
+    expense_id = FIXTURES["update"]["id"]
     
     # Update the expense
     update_data = {
         "description": "Despesa Atualizada",
         "amount": 350.0,
-        "category": "Tecnologia"
+        "category": "Tecnologia",
+        "date": "2024-01-15"
     }
     
-    response = make_request("PUT", f"/expenses/{expense_id}", data=update_data)
+    response = await make_request(client, "PUT", f"/expenses/{expense_id}", data=update_data)
     
     # Verify the response contains the expected fields
-    required_fields = ["id", "description", "amount", "category", "date", "created_at"]
-    for field in required_fields:
-        if field not in response:
-            raise Exception(f"Required field '{field}' not found in response")
+    missing = EXPENSE_FIELDS - response.keys()
+    if missing:
+        raise Exception(f"Required fields {sorted(missing)} not found in response")
     
     # Verify the data was updated correctly
     if response["id"] != expense_id:
@@ -364,68 +548,44 @@ def test_update_expense():
     if response["category"] != update_data["category"]:
         raise Exception(f"Category not updated: expected '{update_data['category']}', got '{response['category']}'")
     
+    if response["date"] != update_data["date"]:
+        raise Exception(f"Date not updated: expected '{update_data['date']}', got '{response['date']}'")
+    
     # Test update with invalid category
     invalid_update = {
         "category": "Categoria Inválida"
     }
     
-    try:
-        make_request("PUT", f"/expenses/{expense_id}", data=invalid_update)
-        raise Exception("Expected validation error for invalid category, but request succeeded")
-    except Exception as e:
-        if "categoria inválida" not in str(e).lower():
-            raise Exception(f"Expected 'Categoria inválida' error, got: {str(e)}")
+    status, body = await request_raw(client, "PUT", f"/expenses/{expense_id}", data=invalid_update)
+    assert_http_error(status, body, 422, *CATEGORY_NEEDLES)
     
     # Test update with negative amount
     negative_update = {
         "amount": -50.0
     }
     
-    try:
-        make_request("PUT", f"/expenses/{expense_id}", data=negative_update)
-        raise Exception("Expected validation error for negative amount, but request succeeded")
-    except Exception as e:
-        if "amount" not in str(e).lower() and "valor" not in str(e).lower():
-            raise Exception(f"Expected error related to amount/valor, got: {str(e)}")
+    status, body = await request_raw(client, "PUT", f"/expenses/{expense_id}", data=negative_update)
+    assert_http_error(status, body, 422, *AMOUNT_NEEDLES)
     
     # Test update with invalid date format
     invalid_date_update = {
         "date": "01/01/2023"  # Wrong format, should be YYYY-MM-DD
     }
     
-    try:
-        make_request("PUT", f"/expenses/{expense_id}", data=invalid_date_update)
-        raise Exception("Expected validation error for invalid date format, but request succeeded")
-    except Exception as e:
-        if "data" not in str(e).lower() and "date" not in str(e).lower():
-            raise Exception(f"Expected error related to date/data, got: {str(e)}")
+    status, body = await request_raw(client, "PUT", f"/expenses/{expense_id}", data=invalid_date_update)
+    assert_http_error(status, body, 422, *DATE_NEEDLES)
     
-    # Test update with non-existent ID
-    non_existent_id = "00000000-0000-0000-0000-000000000000"
-    try:
-        make_request("PUT", f"/expenses/{non_existent_id}", data=update_data)
-        raise Exception(f"Expected 404 error for non-existent ID, but request succeeded")
-    except Exception as e:
-        if "não encontrada" not in str(e).lower() and "not found" not in str(e).lower():
-            raise Exception(f"Expected 'not found' error, got: {str(e)}")
-    
-    return {"updated_expense": response}
+    # Test update with a non-existent ID, and with one that is not an ObjectId
+    for unknown_id in (MISSING_EXPENSE_ID, MALFORMED_EXPENSE_ID):
+        status, body = await request_raw(client, "PUT", f"/expenses/{unknown_id}", data=update_data)
+        assert_http_error(status, body, 404, *NOT_FOUND_NEEDLES)
 
-def test_delete_expense():
+async def test_delete_expense(client: httpx.AsyncClient):
     """Test the DELETE /api/expenses/{id} endpoint"""
-    # Create an expense first
-    expense_data = {
-        "description": "Despesa para Exclusão",
-        "amount": 250.0,
-        "category": "Roupas",
-        "date": datetime.datetime.now().strftime("%Y-%m-%d")
-    }
-    
-    created_expense = make_request("POST", "/expenses", data=expense_data)
-    expense_id = created_expense["id"]
+    expense_id = FIXTURES["delete"]["id"]
     
     # Delete the expense
-    response = make_request("DELETE", f"/expenses/{expense_id}")
+    response = await make_request(client, "DELETE", f"/expenses/{expense_id}")
     
     # Verify the response contains a success message
     if "message" not in response:
@@ -435,48 +595,32 @@ def test_delete_expense():
         raise Exception(f"Expected success message, got: {response['message']}")
     
     # Verify the expense was actually deleted
-    try:
-        make_request("GET", f"/expenses/{expense_id}")
-        raise Exception(f"Expected 404 error after deletion, but request succeeded")
-    except Exception as e:
-        if "não encontrada" not in str(e).lower() and "not found" not in str(e).lower():
-            raise Exception(f"Expected 'not found' error, got: {str(e)}")
-    
-    # Test delete with non-existent ID
-    non_existent_id = "00000000-0000-0000-0000-000000000000"
-    try:
-        make_request("DELETE", f"/expenses/{non_existent_id}")
-        raise Exception(f"Expected 404 error for non-existent ID, but request succeeded")
-    except Exception as e:
-        if "não encontrada" not in str(e).lower() and "not found" not in str(e).lower():
-            raise Exception(f"Expected 'not found' error, got: {str(e)}")
+    status, body = await request_raw(client, "GET", f"/expenses/{expense_id}")
+    assert_http_error(status, body, 404, *NOT_FOUND_NEEDLES)
     
-    return {"delete_result": "Expense successfully deleted"}
+    # Test delete with a non-existent ID, and with one that is not an ObjectId
+    for unknown_id in (MISSING_EXPENSE_ID, MALFORMED_EXPENSE_ID):
+        status, body = await request_raw(client, "DELETE", f"/expenses/{unknown_id}")
+        assert_http_error(status, body, 404, *NOT_FOUND_NEEDLES)
 
-def test_dashboard_stats():
+async def test_dashboard_stats(client: httpx.AsyncClient):
     """Test the GET /api/dashboard/stats endpoint"""
     # Create multiple expenses with different categories
-    expenses = []
     test_data = [
-        {"description": "Despesa de Alimentação", "amount": 150.0, "category": "Alimentação"},
-        {"description": "Despesa de Transporte", "amount": 100.0, "category": "Transporte"},
-        {"description": "Despesa de Lazer", "amount": 200.0, "category": "Lazer"},
-        {"description": "Outra Despesa de Alimentação", "amount": 120.0, "category": "Alimentação"}
+        make_expense(description="Despesa de Alimentação", amount=150.0),
+        make_expense(description="Despesa de Transporte", amount=100.0, category="Transporte"),
+        make_expense(description="Despesa de Lazer", amount=200.0, category="Lazer"),
+        make_expense(description="Outra Despesa de Alimentação", amount=120.0)
     ]
-    
-    for data in test_data:
-        data["date"] = datetime.datetime.now().strftime("%Y-%m-%d")
-        response = make_request("POST", "/expenses", data=data)
-        expenses.append(response)
+    expenses = await create_expenses(client, test_data)
     
     # Get dashboard stats
-    response = make_request("GET", "/dashboard/stats")
+    response = await make_request(client, "GET", "/dashboard/stats")
     
     # Verify the response contains the expected fields
-    required_fields = ["total_expenses", "total_count", "average_expense", "categories_used", "monthly_total"]
-    for field in required_fields:
-        if field not in response:
-            raise Exception(f"Required field '{field}' not found in response")
+    missing = DASHBOARD_STATS_FIELDS - response.keys()
+    if missing:
+        raise Exception(f"Required fields {sorted(missing)} not found in response")
     
     # Verify the stats are calculated correctly
     # Note: This assumes there are no other expenses in the database from previous tests
@@ -498,61 +642,113 @@ def test_dashboard_stats():
     
     if response["monthly_total"] < expected_total:
         raise Exception(f"Expected monthly total to be at least {expected_total}, got {response['monthly_total']}")
-    
-    return {"dashboard_stats": response}
 
-def test_category_summaries():
+async def test_dashboard_stats_after_write(client: httpx.AsyncClient):
+    """Test that GET /api/dashboard/stats reflects a write made just before it"""
+    # Warm the server's dashboard cache, then write and read again; the client
+    # multiplexes everything over one HTTP/2 connection, so both reads reach
+    # the worker that handled the write
+    before = await make_request(client, "GET", "/dashboard/stats")
+    expense = (await create_expenses(client, [make_expense(description="Despesa para o Painel", amount=42.5)]))[0]
+    after = await make_request(client, "GET", "/dashboard/stats")
+    
+    for field in ("total_expenses", "monthly_total"):
+        expected = before[field] + expense["amount"]
+        if abs(after[field] - expected) > 1e-6:
+            raise Exception(f"Expected {field} {expected} right after the write, got {after[field]}")
+
+async def test_category_summaries(client: httpx.AsyncClient):
     """Test the GET /api/dashboard/categories endpoint"""
     # Get category summaries
-    response = make_request("GET", "/dashboard/categories")
+    response = await make_request(client, "GET", "/dashboard/categories")
     
     if not isinstance(response, list):
         raise Exception(f"Expected a list of category summaries, got {type(response)}")
     
     # Verify each summary has the expected fields
     for summary in response:
-        required_fields = ["category", "total", "count", "percentage"]
-        for field in required_fields:
-            if field not in summary:
-                raise Exception(f"Required field '{field}' not found in category summary")
+        missing = CATEGORY_SUMMARY_FIELDS - summary.keys()
+        if missing:
+            raise Exception(f"Required fields {sorted(missing)} not found in category summary")
     
     # Verify the percentages sum to approximately 100%
     total_percentage = sum(summary["percentage"] for summary in response)
     if response and abs(total_percentage - 100.0) > 0.1:  # Allow for small floating-point errors
         raise Exception(f"Expected percentages to sum to 100%, got {total_percentage}%")
-    
-    return {"category_summaries": response}
 
-def run_all_tests():
-    """Run all API tests"""
-    # Test categories API
-    run_test("Get Categories", test_get_categories)
-    
-    # Test expenses CRUD
-    created_expense = run_test("Create Expense", test_create_expense)
-    run_test("Create Expense Validations", test_create_expense_validations)
-    run_test("Get Expenses with Pagination", test_get_expenses)
-    
-    if created_expense:
-        expense_id = created_expense.get("created_expense", {}).get("id")
-        if expense_id:
-            run_test("Get Expense by ID", test_get_expense_by_id)
-    
-    run_test("Update Expense", test_update_expense)
-    run_test("Delete Expense", test_delete_expense)
-    
-    # Test dashboard APIs
-    run_test("Dashboard Stats", test_dashboard_stats)
-    run_test("Category Summaries", test_category_summaries)
+# Tests that create, change or delete expenses
+WRITER_TESTS = (
+    "Setup Fixtures", "Create Expense", "Create Expenses in Bulk", "Update Expense",
+    "Delete Expense", "Dashboard Stats", "Get Expenses by Cursor"
+)
+
+# (name, test function, tests that must pass first, tests that only have to
+# finish first). Pagination compares two successive listings, so it runs
+# after every test that writes expenses, whatever their outcome.
+TESTS = (
+    ("Setup Fixtures", setup_fixtures, (), ()),
+    ("Get Categories", test_get_categories, (), ()),
+    ("Create Expense", test_create_expense, (), ()),
+    ("Get Expense by ID", test_get_expense_by_id, ("Setup Fixtures",), ()),
+    ("Create Expense Validations", test_create_expense_validations, (), ()),
+    ("Create Expenses in Bulk", test_create_expenses_bulk, (), ()),
+    ("Batch Validation", test_batch_validation, (), ()),
+    ("Update Expense", test_update_expense, ("Setup Fixtures",), ()),
+    ("Delete Expense", test_delete_expense, ("Setup Fixtures",), ()),
+    ("Dashboard Stats", test_dashboard_stats, (), ()),
+    ("Category Summaries", test_category_summaries, (), ()),
+    ("Get Expenses by Cursor", test_get_expenses_cursor, (), ()),
+    ("Dashboard Stats After Write", test_dashboard_stats_after_write, (), WRITER_TESTS),
+    ("Get Expenses with Pagination", test_get_expenses, (), WRITER_TESTS + ("Dashboard Stats After Write",)),
+)
+
+def make_client() -> httpx.AsyncClient:
+    """Build the HTTP/2 client shared by every test"""
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=LIMITS, retries=2)
+    return httpx.AsyncClient(base_url=BASE_URL, transport=transport, headers={"Content-Type": "application/json"}, timeout=10)
+
+# Under pytest every test runs on one session event loop with one client,
+# and the shared fixtures are created before the first test uses it
+if pytest_asyncio is not None:
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
+    async def client():
+        async with make_client() as client:
+            await setup_fixtures(client)
+            yield client
+
+async def run_all_tests():
+    """Run all API tests, each wave of independent tests concurrently"""
+    async with make_client() as client:
+        results = {}
+        pending = list(TESTS)
+        while pending:
+            ready = [test for test in pending if all(dep in results for dep in test[2] + test[3])]
+            if not ready:
+                raise RuntimeError(f"Unresolvable test dependencies: {[test[0] for test in pending]}")
+            pending = [test for test in pending if test not in ready]
+            runnable = []
+            for name, test_func, requires, _ in ready:
+                if all(results[dep] for dep in requires):
+                    runnable.append((name, test_func))
+                else:
+                    print(f"\n⏭️  Skipping {name}: a prerequisite failed")
+                    results[name] = False
+            outcomes = await asyncio.gather(*(run_test(name, test_func, client) for name, test_func in runnable))
+            results.update(zip((name for name, _ in runnable), outcomes))
     
     # Print summary
-    print("\n" + "="*80)
-    print(f"TEST SUMMARY: {test_results['passed_tests']}/{test_results['total_tests']} tests passed")
-    print(f"Passed: {test_results['passed_tests']}")
-    print(f"Failed: {test_results['failed_tests']}")
-    print("="*80)
+    sys.stdout.write(
+        f"\n{_BAR}"
+        f"TEST SUMMARY: {test_results['passed_tests']}/{test_results['total_tests']} tests passed\n"
+        f"Passed: {test_results['passed_tests']}\n"
+        f"Failed: {test_results['failed_tests']}\n"
+        f"{_BAR}"
+    )
+    sys.stdout.flush()
     
     return test_results
 
 if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
+    asyncio.run(run_all_tests())
\ No newline at end of file
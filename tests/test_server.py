@@ -0,0 +1,62 @@
+import datetime
+import pathlib
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+pytest.importorskip("httpx")  # used by TestClient
+
+from bson import ObjectId
+from fastapi.testclient import TestClient
+from pymongo.errors import BulkWriteError
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "backend"))
+import server  # noqa: E402
+
+TODAY = datetime.date.today().isoformat()
+
+
+class PartiallyFailingCollection:
+    """Collection whose insert_many stores every document but the given indexes"""
+
+    def __init__(self, failing_indexes):
+        self.failing_indexes = failing_indexes
+        self.stored = []
+
+    async def insert_many(self, documents, ordered=True):
+        write_errors = []
+        for index, document in enumerate(documents):
+            document["_id"] = ObjectId()
+            if index in self.failing_indexes:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"})
+            else:
+                self.stored.append(document)
+        raise BulkWriteError({"writeErrors": write_errors, "nInserted": len(self.stored)})
+
+
+@pytest.fixture
+def collection():
+    collection = PartiallyFailingCollection({1})
+    server.app.dependency_overrides[server.get_expenses_collection] = lambda: collection
+    yield collection
+    server.app.dependency_overrides.clear()
+
+
+def test_bulk_partial_failure_reports_created_and_failed_rows(collection):
+    server.DASHBOARD_CACHE["stats"] = "stale"
+    payloads = [
+        {"description": f"Despesa {i}", "amount": 10.0 + i, "category": "Outros", "date": TODAY}
+        for i in range(3)
+    ]
+
+    response = TestClient(server.app).post("/api/expenses/bulk", json=payloads)
+
+    assert response.status_code == 207
+    body = response.json()
+    assert [expense["id"] for expense in body["created"]] == [str(doc["_id"]) for doc in collection.stored]
+    assert [expense["description"] for expense in body["created"]] == ["Despesa 0", "Despesa 2"]
+    assert [failure["index"] for failure in body["failed"]] == [1]
+    # The stored rows count towards the totals, so the cache must be dropped
+    assert "stats" not in server.DASHBOARD_CACHE